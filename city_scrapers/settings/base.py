@@ -46,3 +46,9 @@ EXTENSIONS = {
 }
 
 CLOSESPIDER_ERRORCOUNT = 5
+
+# Cache responses locally so repeated development runs don't re-fetch pages
+HTTPCACHE_ENABLED = True
+HTTPCACHE_EXPIRATION_SECS = 86400
+HTTPCACHE_STORAGE = "scrapy.extensions.httpcache.FilesystemCacheStorage"
+HTTPCACHE_POLICY = "scrapy.extensions.httpcache.RFC2616Policy"
@@ -10,6 +10,8 @@ ITEM_PIPELINES = {
     "city_scrapers_core.pipelines.OpenCivicDataPipeline": 400,
 }
 
+HTTPCACHE_ENABLED = False
+
 SENTRY_DSN = os.getenv("SENTRY_DSN")
 
 EXTENSIONS = {